@@ -0,0 +1,52 @@
+"""
+Page text extraction for the PDF Reader MCP Server.
+
+Only pypdfium2 is imported here, so the worker processes that extract large
+PDFs start quickly and never import FastMCP or the server module itself.
+"""
+
+
+import threading
+from typing import List, Union
+
+import pypdfium2 as pdfium
+
+
+# PDFium is not thread-safe, so in-process calls into it are serialised
+PDFIUM_LOCK = threading.Lock()
+
+
+def read_page_text(pdf: pdfium.PdfDocument, page_index: int) -> str:
+    """Extract the text of one page of an open PDF document."""
+    with PDFIUM_LOCK:
+        page = pdf[page_index]
+        try:
+            # Blank pages have no page objects, so skip building a text page
+            if not pdfium.raw.FPDFPage_CountObjects(page):
+                return ""
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_bounded()
+            finally:
+                textpage.close()
+        finally:
+            page.close()
+    # PDFium separates lines with CRLF; normalise to plain newlines
+    return text.replace("\r\n", "\n")
+
+
+def extract_pages(file_path: str, page_indices: List[int]) -> List[Union[str, Exception]]:
+    """
+    Extract the text of the given pages (runs in a worker process).
+
+    A failing page yields its exception in place of the text so the rest
+    of the pages are still returned.
+    """
+    results = []
+    with pdfium.PdfDocument(file_path) as pdf:
+        for page_index in page_indices:
+            try:
+                results.append(read_page_text(pdf, page_index))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                results.append(e)
+    return results
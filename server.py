@@ -6,7 +6,7 @@ A Model Context Protocol (MCP) server for extracting text content from PDF files
 comprehensive error handling, encoding detection, and standardised JSON output.
 
 Features:
-- Text extraction from PDF files using PyPDF2
+- Text extraction from PDF files using pypdfium2 (PDFium)
 - Error handling for corrupt, encrypted, or invalid PDFs
 - Standardized JSON output format with detailed metadata
 
@@ -19,11 +19,27 @@ Email: ola@entrypoint.tech
 import os
 import logging
 import asyncio
-from typing import Dict, Any
+import copy
+import functools
+import hashlib
+import json
+import multiprocessing
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
-import PyPDF2
+import pypdfium2 as pdfium
 from fastmcp import FastMCP
+from pydantic import StrictInt
+
+from pdf_pages import PDFIUM_LOCK, extract_pages, read_page_text
 
 
 logging.basicConfig(level=logging.INFO)
@@ -32,6 +48,79 @@ logger = logging.getLogger(__name__)
 
 mcp = FastMCP("pdf-reader")
 
+# Largest file, and most pages per request, that will be extracted
+MAX_PDF_BYTES = int(os.environ.get("MCP_PDF_MAX_BYTES", 200 * 1024 * 1024))
+MAX_PDF_PAGES = int(os.environ.get("MCP_PDF_MAX_PAGES", 5000))
+
+# Requests for at least this many pages have their text extracted in worker
+# processes; below it, pages read in-process (~0.8 ms each) finish before a
+# freshly spawned worker is ready, which takes ~0.9 s because multiprocessing
+# re-runs the main script (server.py or the fastmcp CLI) in every worker
+PARALLEL_MIN_PAGES = 1000
+
+# Guards creation and replacement of the shared page extraction process pool
+_PROCESS_POOL_LOCK = threading.Lock()
+
+# Formats of each page's section in the extracted text
+PAGE_TEMPLATE = "--- Page %d ---\n%s\n\n"
+PAGE_ERROR_TEMPLATE = "--- Page %d ---\n[Error extracting text from this page]\n\n"
+
+# Maximum number of extraction results kept in memory by read_local_pdf
+PDF_CACHE_SIZE = 32
+
+# Successful results keyed by (absolute path, mtime in ns, size, pages,
+# metadata_only), oldest first
+_PDF_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+# Directory of the persistent extraction cache; an empty value disables it
+PDF_CACHE_DIR = os.environ.get(
+    "MCP_PDF_CACHE_DIR", os.path.expanduser("~/.cache/mcp-pdf-reader")
+)
+
+# Total compressed size of the persistent cache; least recently used entries
+# are pruned beyond it
+PDF_CACHE_MAX_BYTES = int(os.environ.get("MCP_PDF_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+# Bytes hashed from the start and end of a file to identify it in the
+# persistent cache; the end holds the PDF trailer and cross-reference table
+CACHE_KEY_HEAD_BYTES = 64 * 1024
+CACHE_KEY_TAIL_BYTES = 64 * 1024
+
+# Minimum age, in seconds, before a cache hit refreshes an entry's access time;
+# pruning only needs a rough recency order, and most hits then stay read-only
+DISK_CACHE_TOUCH_INTERVAL = 60 * 60
+
+# Part of every persistent cache key; bump it whenever the result format changes
+DISK_CACHE_VERSION = 1
+
+# The persistent cache connection is opened once and shared by the tool
+# worker threads
+_DISK_CACHE_LOCK = threading.Lock()
+
+# Maximum number of decoded page count/metadata entries kept in memory
+METADATA_CACHE_SIZE = 256
+
+# Decoded document info keyed by (absolute path, mtime in ns, size), oldest first
+_METADATA_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+# Bytes read from the start and end of a file by the quick PDF probe
+PROBE_HEAD_BYTES = 1024
+PROBE_TAIL_BYTES = 2048
+
+# Maximum number of threads statting files concurrently in list_pdf_files
+STAT_WORKERS = 32
+
+# Response metadata fields and the document info keys they are read from
+METADATA_FIELDS = (
+    ("title", "Title"),
+    ("author", "Author"),
+    ("subject", "Subject"),
+    ("creator", "Creator"),
+    ("producer", "Producer"),
+    ("creation_date", "CreationDate"),
+    ("modification_date", "ModDate"),
+)
+
 
 def _create_error_response(error: str, message: str) -> Dict[str, Any]:
     """Create a standardized error response."""
@@ -42,76 +131,432 @@ def _create_error_response(error: str, message: str) -> Dict[str, Any]:
     }
 
 
-def extract_text_from_pdf(file_path: str) -> Dict[str, Any]:
+def _create_load_error_response(error: pdfium.PdfiumError) -> Dict[str, Any]:
+    """Create the error response for a PDF that PDFium could not open."""
+    # PDFium refuses to open encrypted documents without the password
+    if error.err_code == pdfium.raw.FPDF_ERR_PASSWORD:
+        return _create_error_response(
+            "PDF_ENCRYPTED",
+            "PDF file is encrypted and requires a password"
+        )
+    return _create_error_response(
+        "PDF_READ_ERROR",
+        f"Could not read PDF file: {str(error)}"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _create_process_pool() -> ProcessPoolExecutor:
+    """Create the shared process pool used for page text extraction."""
+    # Tools run in worker threads, so never fork while another thread may hold a lock
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    # Without the lock, threads making the first call together could each create a pool
+    with _PROCESS_POOL_LOCK:
+        return _create_process_pool()
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken process pool so the next large request starts a fresh one."""
+    with _PROCESS_POOL_LOCK:
+        # Another request may already have replaced it
+        if _create_process_pool() is pool:
+            _create_process_pool.cache_clear()
+    pool.shutdown(wait=False)
+
+
+def _get_chunk_result(
+    pool: ProcessPoolExecutor,
+    future: Future,
+    offset: int,
+    pdf: pdfium.PdfDocument,
+    page_index: int
+) -> str:
+    """
+    Return one page's text from a page chunk future, re-raising its error.
+
+    If a worker process died, the pool is discarded and the page is read
+    in-process instead.
+    """
+    try:
+        result = future.result()[offset]
+    except BrokenProcessPool:
+        _discard_process_pool(pool)
+        return read_page_text(pdf, page_index)
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+def _get_page_extractors(
+    file_path: str, pdf: pdfium.PdfDocument, page_indices: List[int]
+) -> list:
+    """
+    Return one callable per requested page that yields the page text.
+
+    Large requests on multi-core machines are split into page chunks, one
+    per CPU, so each worker process opens the document only once. Otherwise
+    pages are read in-process.
+    """
+    in_process_extractors = [
+        functools.partial(read_page_text, pdf, page_index)
+        for page_index in page_indices
+    ]
+    num_pages = len(page_indices)
+    cpu_count = os.cpu_count() or 1
+    if num_pages < PARALLEL_MIN_PAGES or cpu_count < 2:
+        return in_process_extractors
+
+    pool = _get_process_pool()
+    chunk = max(1, num_pages // cpu_count)
+    extractors = []
+    try:
+        for start in range(0, num_pages, chunk):
+            chunk_indices = page_indices[start:start + chunk]
+            future = pool.submit(extract_pages, file_path, chunk_indices)
+            extractors.extend(
+                functools.partial(
+                    _get_chunk_result, pool, future, offset, pdf, page_index
+                )
+                for offset, page_index in enumerate(chunk_indices)
+            )
+    except BrokenProcessPool:
+        # A worker died since the pool was last used
+        _discard_process_pool(pool)
+        return in_process_extractors
+    return extractors
+
+
+def _select_page_indices(
+    num_pages: int, pages: Optional[Union[int, List[int]]], metadata_only: bool
+) -> List[int]:
+    """
+    Translate the requested 1-based page numbers into 0-based page indices.
+
+    Raises:
+        ValueError: If no pages are requested, or a requested page is not a
+            page number or does not exist in the document
+    """
+    if metadata_only:
+        return []
+    if pages is None:
+        return list(range(num_pages))
+
+    page_numbers = [pages] if isinstance(pages, int) else list(dict.fromkeys(pages))
+    if not page_numbers:
+        raise ValueError("No page numbers requested")
+    # bool is a subclass of int, but True is not a page number
+    if any(isinstance(page, bool) for page in page_numbers):
+        raise ValueError("Page numbers must be integers, not booleans")
+    invalid = [page for page in page_numbers if not 1 <= page <= num_pages]
+    if invalid:
+        raise ValueError(
+            f"Page numbers out of range 1-{num_pages}: "
+            f"{', '.join(str(page) for page in invalid)}"
+        )
+    return [page - 1 for page in page_numbers]
+
+
+def _get_pages_key(pages: Optional[Union[int, List[int]]]) -> Optional[Tuple[int, ...]]:
+    """Return a hashable form of the requested page numbers."""
+    if pages is None:
+        return None
+    return (pages,) if isinstance(pages, int) else tuple(pages)
+
+
+def _extract_text_content(
+    file_path: str, pdf: pdfium.PdfDocument, page_indices: List[int]
+) -> Tuple[str, int, int]:
+    """
+    Return the combined text of the given pages, how many had text, and how
+    many could not be extracted.
+    """
+    text_parts = []
+    extracted_pages = 0
+    failed_pages = 0
+    warn_enabled = logger.isEnabledFor(logging.WARNING)
+
+    page_extractors = _get_page_extractors(file_path, pdf, page_indices)
+    for page_index, extract_page in zip(page_indices, page_extractors):
+        page_num = page_index + 1
+        try:
+            page_text = extract_page()
+            if page_text:
+                text_parts.append(PAGE_TEMPLATE % (page_num, page_text))
+                extracted_pages += 1
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            if warn_enabled:
+                logger.warning(
+                    "Could not extract text from page %s: %s", page_num, e
+                )
+            text_parts.append(PAGE_ERROR_TEMPLATE % page_num)
+            failed_pages += 1
+
+    # Clean up the text, composing any decomposed characters in a single pass
+    text_content = "".join(text_parts).strip()
+    if not unicodedata.is_normalized("NFC", text_content):
+        text_content = unicodedata.normalize("NFC", text_content)
+    return text_content, extracted_pages, failed_pages
+
+
+def _get_metadata_cache_key(file_path: str) -> Optional[tuple]:
+    """Return the document info cache key for a file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def _get_cached_document_info(file_path: str) -> Optional[Dict[str, Any]]:
+    """Return the cached page count and metadata of an unchanged file, if any."""
+    cache_key = _get_metadata_cache_key(file_path)
+    try:
+        # Tolerate the entry being evicted concurrently by another thread
+        _METADATA_CACHE.move_to_end(cache_key)
+        return copy.deepcopy(_METADATA_CACHE[cache_key])
+    except KeyError:
+        return None
+
+
+def _store_document_info(cache_key: tuple, info: Dict[str, Any]) -> None:
+    """Add document info to the cache, evicting the least recently used entry."""
+    _METADATA_CACHE[cache_key] = copy.deepcopy(info)
+    if len(_METADATA_CACHE) > METADATA_CACHE_SIZE:
+        _METADATA_CACHE.popitem(last=False)
+
+
+def _get_document_info(file_path: str, pdf: pdfium.PdfDocument) -> Dict[str, Any]:
+    """Return the page count and decoded metadata of an open document."""
+    info = _get_cached_document_info(file_path)
+    if info is not None:
+        return info
+
+    metadata = pdf.get_metadata_dict(skip_empty=True)
+    info = {
+        "page_count": len(pdf),
+        "metadata": {
+            field: metadata.get(pdf_key, "Unknown")
+            for field, pdf_key in METADATA_FIELDS
+        }
+    }
+
+    cache_key = _get_metadata_cache_key(file_path)
+    if cache_key is not None:
+        _store_document_info(cache_key, info)
+    return info
+
+
+@functools.lru_cache(maxsize=None)
+def _open_disk_cache() -> Optional[sqlite3.Connection]:
+    """Open the persistent extraction cache, or return None if it is disabled or unavailable."""
+    if not PDF_CACHE_DIR:
+        return None
+    try:
+        os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        db = sqlite3.connect(
+            os.path.join(PDF_CACHE_DIR, "cache.db"), check_same_thread=False
+        )
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key BLOB PRIMARY KEY, mtime_ns INTEGER NOT NULL, accessed REAL NOT NULL, "
+            "size INTEGER NOT NULL, result BLOB NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+        db.commit()
+        return db
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Persistent PDF cache disabled: %s", e)
+        return None
+
+
+def _get_disk_cache() -> Optional[sqlite3.Connection]:
+    """Return the shared persistent cache connection, opening it on first use."""
+    # Without the lock, threads making the first call together could each open one
+    with _DISK_CACHE_LOCK:
+        return _open_disk_cache()
+
+
+def _get_disk_cache_key(
+    file_path: str,
+    file_size: int,
+    pages: Optional[Union[int, List[int]]],
+    metadata_only: bool
+) -> Optional[bytes]:
+    """
+    Return the persistent cache key for a request, or None if the cache is off.
+
+    Files are identified by their first CACHE_KEY_HEAD_BYTES, last
+    CACHE_KEY_TAIL_BYTES and size rather than their path, so the entry
+    survives renames and server restarts.
+    """
+    if _get_disk_cache() is None:
+        return None
+    with open(file_path, 'rb') as pdf_file:
+        digest = hashlib.blake2b(pdf_file.read(CACHE_KEY_HEAD_BYTES), digest_size=16)
+        # Files that share a head usually differ in their trailer
+        if file_size > CACHE_KEY_HEAD_BYTES:
+            pdf_file.seek(max(CACHE_KEY_HEAD_BYTES, file_size - CACHE_KEY_TAIL_BYTES))
+            digest.update(pdf_file.read(CACHE_KEY_TAIL_BYTES))
+    digest.update(file_size.to_bytes(8, "little"))
+    digest.update(repr((DISK_CACHE_VERSION, _get_pages_key(pages), metadata_only)).encode())
+    return digest.digest()
+
+
+def _load_disk_cached_result(key: Optional[bytes], mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Return a persisted result for an unmodified file, if there is one."""
+    db = _get_disk_cache()
+    if key is None or db is None:
+        return None
+    try:
+        with _DISK_CACHE_LOCK:
+            row = db.execute(
+                "SELECT result, accessed FROM results WHERE key = ? AND mtime_ns = ?",
+                (key, mtime_ns)
+            ).fetchone()
+            now = time.time()
+            if row and now - row[1] > DISK_CACHE_TOUCH_INTERVAL:
+                with db:
+                    db.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(zlib.decompress(row[0])) if row else None
+    except (sqlite3.Error, zlib.error, ValueError) as e:
+        logger.warning("Could not read persistent PDF cache: %s", e)
+        return None
+
+
+def _prune_disk_cache(db: sqlite3.Connection) -> None:
+    """Delete the least recently used entries until the cache fits PDF_CACHE_MAX_BYTES."""
+    total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+    if total <= PDF_CACHE_MAX_BYTES:
+        return
+    stale_keys = []
+    for key, size in db.execute("SELECT key, size FROM results ORDER BY accessed"):
+        if total <= PDF_CACHE_MAX_BYTES:
+            break
+        stale_keys.append((key,))
+        total -= size
+    db.executemany("DELETE FROM results WHERE key = ?", stale_keys)
+
+
+def _store_disk_cached_result(
+    key: Optional[bytes], mtime_ns: int, result: Dict[str, Any]
+) -> None:
+    """
+    Persist a successful result, replacing any entry for an older version.
+
+    Least recently used entries are then pruned to keep the cache within
+    PDF_CACHE_MAX_BYTES.
+    """
+    db = _get_disk_cache()
+    if key is None or db is None:
+        return
+    blob = zlib.compress(json.dumps(result).encode(), 1)
+    try:
+        with _DISK_CACHE_LOCK, db:
+            db.execute(
+                "INSERT OR REPLACE INTO results (key, mtime_ns, accessed, size, result) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, mtime_ns, time.time(), len(blob), blob)
+            )
+            _prune_disk_cache(db)
+    except sqlite3.Error as e:
+        logger.warning("Could not write persistent PDF cache: %s", e)
+
+
+def extract_text_from_pdf(  # pylint: disable=too-many-return-statements
+    file_path: str,
+    pages: Optional[Union[int, List[int]]] = None,
+    metadata_only: bool = False
+) -> Dict[str, Any]:
     """
     Extract text from PDF with comprehensive error handling.
+
+    Only the 1-based page numbers in pages are extracted (all pages when
+    None); with metadata_only no page text is extracted at all.
     """
     try:
-        with open(file_path, 'rb') as pdf_file:
-            # Create PDF reader
+        # Refuse oversized files before PDFium loads them
+        file_stat = os.stat(file_path)
+        if file_stat.st_size > MAX_PDF_BYTES:
+            return _create_error_response(
+                "PDF_TOO_LARGE",
+                f"PDF file is {file_stat.st_size} bytes, "
+                f"larger than the {MAX_PDF_BYTES} byte limit"
+            )
+
+        # Reuse the result of an earlier run, possibly before a restart
+        disk_key = _get_disk_cache_key(file_path, file_stat.st_size, pages, metadata_only)
+        result = _load_disk_cached_result(disk_key, file_stat.st_mtime_ns)
+        if result is not None:
+            # Let read_pdf_metadata answer from memory from now on
+            _store_document_info(
+                (file_path, file_stat.st_mtime_ns, file_stat.st_size),
+                {
+                    "page_count": result["data"]["page_count"],
+                    "metadata": result["data"]["metadata"]
+                }
+            )
+            return result
+
+        # Open PDF document
+        try:
+            with PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(file_path)
+        except pdfium.PdfiumError as e:
+            return _create_load_error_response(e)
+        except (FileNotFoundError, PermissionError):
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return _create_error_response(
+                "UNKNOWN_PDF_ERROR",
+                f"Unexpected error reading PDF: {str(e)}"
+            )
+
+        try:
+            # Get basic PDF info
+            with PDFIUM_LOCK:
+                info = _get_document_info(file_path, pdf)
+
             try:
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-            except PyPDF2.errors.PdfReadError as e:
-                return _create_error_response(
-                    "PDF_READ_ERROR",
-                    f"Could not read PDF file: {str(e)}"
-                )
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                return _create_error_response(
-                    "UNKNOWN_PDF_ERROR",
-                    f"Unexpected error reading PDF: {str(e)}"
+                page_indices = _select_page_indices(
+                    info["page_count"], pages, metadata_only
                 )
+            except ValueError as e:
+                return _create_error_response("INVALID_PAGE_NUMBER", str(e))
 
-            # Check if PDF is encrypted
-            if pdf_reader.is_encrypted:
+            if len(page_indices) > MAX_PDF_PAGES:
                 return _create_error_response(
-                    "PDF_ENCRYPTED",
-                    "PDF file is encrypted and requires a password"
+                    "TOO_MANY_PAGES",
+                    f"Cannot extract {len(page_indices)} pages at once "
+                    f"(limit {MAX_PDF_PAGES}); request fewer pages"
                 )
 
-            # Get basic PDF info
-            num_pages = len(pdf_reader.pages)
-            metadata = pdf_reader.metadata or {}
-
-            # Extract text from all pages
-            text_content = ""
-            extracted_pages = 0
-
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content += f"--- Page {page_num} ---\n{page_text}\n\n"
-                        extracted_pages += 1
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    logger.warning(
-                        "Could not extract text from page %s: %s", page_num, e
-                    )
-                    text_content += (
-                        f"--- Page {page_num} ---\n"
-                        "[Error extracting text from this page]\n\n"
-                    )
-
-            # Clean up the text
-            text_content = text_content.strip()
+            # Extract text from the requested pages
+            text_content, extracted_pages, failed_pages = _extract_text_content(
+                file_path, pdf, page_indices
+            )
 
-            return {
+            result = {
                 "success": True,
                 "data": {
                     "text": text_content,
-                    "page_count": num_pages,
+                    "char_count": len(text_content),
+                    "page_count": info["page_count"],
                     "pages_extracted": extracted_pages,
-                    "metadata": {
-                        "title": metadata.get("/Title", "Unknown"),
-                        "author": metadata.get("/Author", "Unknown"),
-                        "subject": metadata.get("/Subject", "Unknown"),
-                        "creator": metadata.get("/Creator", "Unknown"),
-                        "producer": metadata.get("/Producer", "Unknown"),
-                        "creation_date": str(metadata.get("/CreationDate", "Unknown")),
-                        "modification_date": str(metadata.get("/ModDate", "Unknown"))
-                    }
+                    "pages_failed": failed_pages,
+                    "metadata": info["metadata"]
                 }
             }
+            # Pages that failed may succeed next time, so don't persist them
+            if not failed_pages:
+                _store_disk_cached_result(disk_key, file_stat.st_mtime_ns, result)
+            return result
+        finally:
+            with PDFIUM_LOCK:
+                pdf.close()
 
     except (FileNotFoundError, PermissionError) as e:
         error_type = "FILE_NOT_FOUND" if isinstance(e, FileNotFoundError) else "PERMISSION_DENIED"
@@ -126,13 +571,71 @@ def extract_text_from_pdf(file_path: str) -> Dict[str, Any]:
         )
 
 
+def _get_pdf_cache_key(
+    abs_path: str, pages: Optional[Union[int, List[int]]], metadata_only: bool
+) -> Optional[tuple]:
+    """Return the result cache key for a request, or None if the file cannot be stat'ed."""
+    try:
+        stat = os.stat(abs_path)
+    except OSError:
+        return None
+    return (abs_path, stat.st_mtime_ns, stat.st_size, _get_pages_key(pages), metadata_only)
+
+
+def _store_cached_result(cache_key: tuple, result: Dict[str, Any]) -> None:
+    """Add a result to the cache, evicting the least recently used entry."""
+    _PDF_CACHE[cache_key] = copy.deepcopy(result)
+    if len(_PDF_CACHE) > PDF_CACHE_SIZE:
+        _PDF_CACHE.popitem(last=False)
+
+
+def _read_local_pdf(
+    abs_path: str, pages: Optional[Union[int, List[int]]], metadata_only: bool
+) -> Dict[str, Any]:
+    """Return the result for read_local_pdf, serving unchanged files from the cache."""
+    cache_key = _get_pdf_cache_key(abs_path, pages, metadata_only)
+    try:
+        # Tolerate the entry being evicted concurrently by another thread
+        _PDF_CACHE.move_to_end(cache_key)
+        result = copy.deepcopy(_PDF_CACHE[cache_key])
+        logger.info("Returning cached result for PDF: %s", abs_path)
+        return result
+    except KeyError:
+        pass
+
+    result = extract_text_from_pdf(abs_path, pages, metadata_only)
+
+    if result["success"]:
+        # Pages that failed may succeed on a retry, so only cache complete results
+        if cache_key is not None and not result["data"]["pages_failed"]:
+            _store_cached_result(cache_key, result)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Successfully extracted text from PDF: %s", abs_path)
+            logger.info(
+                "Pages: %s, Characters: %s",
+                result['data']['page_count'],
+                result['data']['char_count']
+            )
+    else:
+        logger.error("Failed to extract text from PDF: %s", result['message'])
+
+    return result
+
+
 @mcp.tool()
-async def read_local_pdf(path: str) -> Dict[str, Any]:
+async def read_local_pdf(
+    path: str,
+    pages: Optional[Union[StrictInt, List[StrictInt]]] = None,
+    metadata_only: bool = False
+) -> Dict[str, Any]:
     """
     Read and extract text content from a local PDF file.
 
     Args:
         path: Absolute or relative path to the PDF file
+        pages: 1-based page number or list of page numbers to extract
+            (default: all pages)
+        metadata_only: Return only the page count and metadata, without text
 
     Returns:
         Dictionary with success status, extracted text, and metadata
@@ -143,29 +646,150 @@ async def read_local_pdf(path: str) -> Dict[str, Any]:
     abs_path = os.path.abspath(path)
     logger.info("Resolved absolute path: %s", abs_path)
 
-    # Extract text
-    result = extract_text_from_pdf(abs_path)
+    # Stat and extract the file without blocking the event loop
+    return await asyncio.to_thread(_read_local_pdf, abs_path, pages, metadata_only)
 
-    if result["success"]:
-        logger.info("Successfully extracted text from PDF: %s", abs_path)
-        logger.info(
-            "Pages: %s, Characters: %s",
-            result['data']['page_count'],
-            len(result['data']['text'])
+
+def _pdf_quick_probe(file_path: str, size: int) -> Tuple[bool, bool]:
+    """
+    Cheaply check whether a file looks like a PDF and whether it is encrypted.
+
+    Only the head and tail of the file are read: a PDF has a %PDF- header
+    somewhere in its first PROBE_HEAD_BYTES (readers tolerate leading junk
+    before it), ends with %%EOF, and an encrypted one names its /Encrypt
+    dictionary in the trailer.
+
+    Returns:
+        Tuple of (is_pdf, encrypted_hint)
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            head = os.pread(fd, PROBE_HEAD_BYTES, 0)
+            tail = os.pread(fd, PROBE_TAIL_BYTES, max(0, size - PROBE_TAIL_BYTES))
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.warning("Could not probe %s: %s", file_path, e)
+        return False, False
+
+    is_pdf = b"%PDF-" in head and b"%%EOF" in tail
+    return is_pdf, is_pdf and b"/Encrypt" in tail
+
+
+def _walk_pdf_entries(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the directory entry of every PDF file below a directory.
+
+    Walks the tree with os.scandir and an explicit stack of directories, so
+    deep trees neither hit the recursion limit nor pass every result up
+    through a chain of nested generators.
+    """
+    stack = [root]
+    # Bound once, as the loop below runs for every entry in the tree
+    push_directory = stack.append
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as scan:
+                entries = list(scan)
+        except OSError as e:
+            logger.warning("Could not scan directory %s: %s", directory, e)
+            continue
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                push_directory(entry.path)
+            elif entry.name[-4:].lower() == ".pdf":  # also .PDF, .Pdf, ...
+                yield entry
+
+
+def _describe_pdf_file(entry: os.DirEntry, probe: bool) -> Optional[Dict[str, Any]]:
+    """Return basic info for a PDF file, or None if it cannot be stat'ed."""
+    try:
+        stat = entry.stat()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning("Could not get info for %s: %s", entry.path, e)
+        return None
+
+    pdf_file = {
+        "name": entry.name,
+        "path": entry.path,
+        "size_bytes": stat.st_size,
+        "modified": stat.st_mtime
+    }
+    if probe:
+        pdf_file["is_pdf"], pdf_file["encrypted_hint"] = _pdf_quick_probe(
+            entry.path, stat.st_size
         )
-    else:
-        logger.error("Failed to extract text from PDF: %s", result['message'])
+    return pdf_file
 
-    return result
+
+def _scan_pdf_files(root: str, probe: bool = False) -> List[Dict[str, Any]]:
+    """
+    Return basic info for every PDF file below a directory.
+
+    The stat (and probe) calls release the GIL, so they are issued from a
+    thread pool to overlap their latency on slow or networked filesystems.
+    """
+    entries = list(_walk_pdf_entries(root))
+    if not entries:
+        return []
+
+    describe = functools.partial(_describe_pdf_file, probe=probe)
+    with ThreadPoolExecutor(max_workers=min(STAT_WORKERS, len(entries))) as executor:
+        return [pdf_file for pdf_file in executor.map(describe, entries) if pdf_file]
+
+
+def _read_pdf_metadata(abs_path: str) -> Dict[str, Any]:
+    """Return the result for read_pdf_metadata, serving unchanged files from the cache."""
+    info = _get_cached_document_info(abs_path)
+    if info is not None:
+        return {"success": True, "data": info}
+
+    result = extract_text_from_pdf(abs_path, metadata_only=True)
+    if not result["success"]:
+        logger.error("Failed to read PDF metadata: %s", result['message'])
+        return result
+
+    return {
+        "success": True,
+        "data": {
+            "page_count": result["data"]["page_count"],
+            "metadata": result["data"]["metadata"]
+        }
+    }
 
 
 @mcp.tool()
-async def list_pdf_files(directory: str = ".") -> Dict[str, Any]:
+async def read_pdf_metadata(path: str) -> Dict[str, Any]:
+    """
+    Read the page count and document metadata of a local PDF file.
+
+    No page text is extracted, so this is much cheaper than read_local_pdf.
+
+    Args:
+        path: Absolute or relative path to the PDF file
+
+    Returns:
+        Dictionary with success status, page count, and metadata
+    """
+    abs_path = os.path.abspath(path)
+    logger.info("Reading metadata of PDF: %s", abs_path)
+
+    # Stat and open the file without blocking the event loop
+    return await asyncio.to_thread(_read_pdf_metadata, abs_path)
+
+
+@mcp.tool()
+async def list_pdf_files(directory: str = ".", probe: bool = False) -> Dict[str, Any]:
     """
     List all PDF files in a given directory.
 
     Args:
         directory: Directory path to search for PDFs (default: current directory)
+        probe: Also flag each file as a valid and/or encrypted PDF from a quick
+            look at its header and trailer, without parsing it
 
     Returns:
         Dictionary with list of PDF files and their basic info
@@ -187,18 +811,7 @@ async def list_pdf_files(directory: str = ".") -> Dict[str, Any]:
                 "message": f"Path is not a directory: {directory}"
             }
 
-        pdf_files = []
-        for pdf_path in dir_path.glob("**/*.pdf"):
-            try:
-                stat = pdf_path.stat()
-                pdf_files.append({
-                    "name": pdf_path.name,
-                    "path": str(pdf_path),
-                    "size_bytes": stat.st_size,
-                    "modified": stat.st_mtime
-                })
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning("Could not get info for %s: %s", pdf_path, e)
+        pdf_files = await asyncio.to_thread(_scan_pdf_files, str(dir_path), probe)
 
         return {
             "success": True,
@@ -224,6 +837,7 @@ async def main():
     logger.info("Starting PDF Reader MCP Server on port 8000...")
     logger.info("Available tools:")
     logger.info(" - read_local_pdf: Extract text from a PDF file")
+    logger.info(" - read_pdf_metadata: Read page count and metadata of a PDF file")
     logger.info(" - list_pdf_files: List PDF files in a directory")
 
     try: